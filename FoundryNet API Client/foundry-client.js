@@ -12,7 +12,17 @@ export class FoundryClient {
     this.retryDelay = config.retryDelay || 2000;
     this.debug = config.debug || false;
     this.credentialsFile = config.credentialsFile || '.foundry_credentials.json';
-    
+
+    // Local job queues: submit/complete calls buffer for up to
+    // completeJobBatchDelay ms (or until localQueueSize entries) and
+    // flush as one /batch request instead of one round-trip per job
+    this.localQueueSize = config.localQueueSize || 32;
+    this.completeJobBatchDelayMs = config.completeJobBatchDelay || 10;
+    this.pendingSubmits = [];
+    this.pendingCompletes = [];
+    this.submitTimer = null;
+    this.completeTimer = null;
+
     this.machineUuid = null;
     this.keyPair = null;
   }
@@ -151,6 +161,82 @@ export class FoundryClient {
     }, 'Machine registration');
   }
 
+  async postBatch(ops) {
+    return await this.withRetry(async () => {
+      const response = await fetch(`${this.apiUrl}/batch`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ requests: ops }),
+      });
+
+      if (!response.ok) {
+        const error = await response.text();
+        throw new Error(`Batch request failed: ${error}`);
+      }
+
+      const result = await response.json();
+      return result.responses || [];
+    }, 'Batch request');
+  }
+
+  queueOp(queue, timerProp, op) {
+    return new Promise((resolve, reject) => {
+      queue.push({ op, resolve, reject });
+      if (queue.length >= this.localQueueSize) {
+        this.flushQueue(queue, timerProp);
+      } else if (!this[timerProp]) {
+        this[timerProp] = setTimeout(
+          () => this.flushQueue(queue, timerProp),
+          this.completeJobBatchDelayMs
+        );
+      }
+    });
+  }
+
+  async flushQueue(queue, timerProp) {
+    if (this[timerProp]) {
+      clearTimeout(this[timerProp]);
+      this[timerProp] = null;
+    }
+    const pending = queue.splice(0, queue.length);
+    if (!pending.length) return;
+
+    this.log('debug', 'Flushing job batch', { count: pending.length });
+    try {
+      const responses = await this.postBatch(pending.map(p => p.op));
+      pending.forEach((p, i) => {
+        const res = responses[i];
+        if (res === undefined) {
+          p.reject(new Error(`No batch response for ${p.op.path}`));
+          return;
+        }
+        // Each sub-response carries its own status; the batch call
+        // succeeding doesn't mean every op inside it did
+        const status = res.status ?? 200;
+        const body = res.body ?? res;
+        if (status === 409 && p.op.path === '/submit-job') {
+          this.log('warn', 'Job already exists', { jobHash: p.op.body.job_hash });
+          p.resolve({ success: true, duplicate: true, job_hash: p.op.body.job_hash });
+        } else if (status >= 400) {
+          const error = (body && body.error) || JSON.stringify(body);
+          p.reject(new Error(`${p.op.path} failed: ${error}`));
+        } else {
+          p.resolve(body);
+        }
+      });
+    } catch (error) {
+      pending.forEach(p => p.reject(error));
+    }
+  }
+
+  async flush() {
+    // Force out both queues without waiting for the batch delay
+    await Promise.all([
+      this.flushQueue(this.pendingSubmits, 'submitTimer'),
+      this.flushQueue(this.pendingCompletes, 'completeTimer'),
+    ]);
+  }
+
   async submitJob(jobHash, complexity = 1.0, payload = {}) {
     if (!this.machineUuid) {
       throw new Error('Machine not initialized');
@@ -158,49 +244,26 @@ export class FoundryClient {
 
     // Normalize complexity to 2 decimal places
     const normalized = Math.round(complexity * 100) / 100;
-    
+
     // Validate range with tolerance
     const MIN_COMPLEXITY = 0.5;
     const MAX_COMPLEXITY = 2.0;
     const TOLERANCE = 0.01;
-    
+
     if (normalized < MIN_COMPLEXITY - TOLERANCE || normalized > MAX_COMPLEXITY + TOLERANCE) {
       throw new Error(`Complexity must be ${MIN_COMPLEXITY}-${MAX_COMPLEXITY}, got ${normalized}`);
     }
 
-    return await this.withRetry(async () => {
-      const response = await fetch(`${this.apiUrl}/submit-job`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          machine_uuid: this.machineUuid,
-          job_hash: jobHash,
-          complexity: normalized,
-          payload,
-        }),
-      });
-
-      if (response.status === 409) {
-        this.log('warn', 'Job already exists', { jobHash });
-        return { success: true, duplicate: true, job_hash: jobHash };
-      }
-
-      if (!response.ok) {
-        const text = await response.text();
-        let error = text;
-        try {
-          const json = JSON.parse(text);
-          error = json.error || text;
-        } catch (e) {
-          // Keep raw text
-        }
-        throw new Error(`Job submission failed: ${error}`);
-      }
-
-      const result = await response.json();
-      this.log('debug', 'Job submitted', { jobHash, complexity: normalized });
-      return result;
-    }, 'Job submission');
+    return this.queueOp(this.pendingSubmits, 'submitTimer', {
+      method: 'POST',
+      path: '/submit-job',
+      body: {
+        machine_uuid: this.machineUuid,
+        job_hash: jobHash,
+        complexity: normalized,
+        payload,
+      },
+    });
   }
 
   async completeJob(jobHash, recipientWallet) {
@@ -208,40 +271,33 @@ export class FoundryClient {
       throw new Error('Machine not initialized');
     }
 
+    // Proof is signed upfront; only the HTTP round-trip is batched
     const timestamp = new Date().toISOString();
     const message = `${jobHash}|${recipientWallet}|${timestamp}`;
     const messageBytes = new TextEncoder().encode(message);
     const signature = nacl.sign.detached(messageBytes, this.keyPair.secretKey);
 
-    return await this.withRetry(async () => {
-      const response = await fetch(`${this.apiUrl}/complete-job`, {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          machine_uuid: this.machineUuid,
-          job_hash: jobHash,
-          recipient_wallet: recipientWallet,
-          completion_proof: {
-            timestamp,
-            signature_base58: bs58.encode(signature),
-          },
-        }),
-      });
-
-      if (!response.ok) {
-        const error = await response.text();
-        throw new Error(`Job completion failed: ${error}`);
-      }
+    const result = await this.queueOp(this.pendingCompletes, 'completeTimer', {
+      method: 'POST',
+      path: '/complete-job',
+      body: {
+        machine_uuid: this.machineUuid,
+        job_hash: jobHash,
+        recipient_wallet: recipientWallet,
+        completion_proof: {
+          timestamp,
+          signature_base58: bs58.encode(signature),
+        },
+      },
+    });
 
-     const result = await response.json();
-this.log('info', 'Job completed - MINT earned!', {
-  jobHash,
-  reward: result.reward_net,  // ← Use reward_net instead of reward
-  txSignature: result.tx_signature,
-  activityRatio: result.activity_ratio,
-});
-return result;
-    }, 'Job completion');
+    this.log('info', 'Job completed - MINT earned!', {
+      jobHash,
+      reward: result?.reward_net,
+      txSignature: result?.tx_signature,
+      activityRatio: result?.activity_ratio,
+    });
+    return result;
   }
 
   generateJobHash(filename, additionalData = '') {
@@ -283,17 +339,47 @@ export default FoundryClient;
 // INTEGRATION EXAMPLES
 // ============================================================================
 
+// Fake-work helper: pass { simulateDelayMs: 0 } to skip an example's
+// simulated delay entirely, or a positive value to override its default
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+async function simulateWork(options, defaultMs) {
+  const ms = options?.simulateDelayMs ?? defaultMs;
+  if (ms !== 0) await sleep(ms);
+}
+
+/**
+ * Run job thunks with bounded concurrency. Keeps up to `concurrency`
+ * jobs in flight at once so aggregate flows overlap their waits without
+ * flooding the backend.
+ */
+export async function runAll(
+  jobs: (() => Promise<JobResult>)[],
+  { concurrency = 8 } = {}
+): Promise<JobResult[]> {
+  const results = new Array(jobs.length);
+  let next = 0;
+  const workers = Array.from({ length: Math.min(concurrency, jobs.length) }, async () => {
+    while (next < jobs.length) {
+      const i = next++;
+      results[i] = await jobs[i]();
+    }
+  });
+  await Promise.all(workers);
+  return results;
+}
+
 /**
  * LangChain Agent Example
  * Integrates FoundryClient with LangChain agent execution
  */
-export async function exampleLangChainAgent(client: FoundryClient, query: string): Promise<JobResult> {
+export async function exampleLangChainAgent(client: FoundryClient, query: string, options: any = {}): Promise<JobResult> {
   const jobHash = client.generateJobHash('langchain_agent', query);
   await client.submitJob(jobHash, 1.0, { job_type: 'langchain_agent', query });
 
   // Simulate agent execution (in production, call your LangChain pipeline)
   console.log(`[LangChain Agent] Processing: ${query}`);
-  await new Promise(resolve => setTimeout(resolve, 1000));
+  await simulateWork(options, 1000);
 
   const result = await client.completeJob(jobHash, 'YOUR_WALLET_ADDRESS');
   return result;
@@ -303,12 +389,12 @@ export async function exampleLangChainAgent(client: FoundryClient, query: string
  * LangGraph Workflow Example
  * Tracks complex AI graph flows
  */
-export async function exampleLangGraphWorkflow(client: FoundryClient, workflowInput: any): Promise<JobResult> {
+export async function exampleLangGraphWorkflow(client: FoundryClient, workflowInput: any, options: any = {}): Promise<JobResult> {
   const jobHash = client.generateJobHash('langgraph_workflow', JSON.stringify(workflowInput));
   await client.submitJob(jobHash, 1.2, { job_type: 'langgraph', input: workflowInput });
 
   console.log(`[LangGraph] Executing workflow`);
-  await new Promise(resolve => setTimeout(resolve, 1500));
+  await simulateWork(options, 1500);
 
   const result = await client.completeJob(jobHash, 'YOUR_WALLET_ADDRESS');
   return result;
@@ -318,12 +404,12 @@ export async function exampleLangGraphWorkflow(client: FoundryClient, workflowIn
  * N8N Automation Example
  * Wraps N8N workflow execution
  */
-export async function exampleN8NAutomation(client: FoundryClient, taskData: any): Promise<JobResult> {
+export async function exampleN8NAutomation(client: FoundryClient, taskData: any, options: any = {}): Promise<JobResult> {
   const jobHash = client.generateJobHash('n8n_task', JSON.stringify(taskData));
   await client.submitJob(jobHash, 1.0, { job_type: 'automation', task: taskData });
 
   console.log(`[N8N] Running automation`);
-  await new Promise(resolve => setTimeout(resolve, 800));
+  await simulateWork(options, 800);
 
   const result = await client.completeJob(jobHash, 'YOUR_WALLET_ADDRESS');
   return result;
@@ -333,12 +419,12 @@ export async function exampleN8NAutomation(client: FoundryClient, taskData: any)
  * GPU Training Job Example
  * Rewards ML training runs
  */
-export async function exampleGpuTrainingJob(client: FoundryClient, config: any): Promise<JobResult> {
+export async function exampleGpuTrainingJob(client: FoundryClient, config: any, options: any = {}): Promise<JobResult> {
   const jobHash = client.generateJobHash('gpu_training', JSON.stringify(config));
   await client.submitJob(jobHash, 1.8, { job_type: 'gpu_training', model: config.model });
 
   console.log(`[GPU Training] Training model: ${config.model}`);
-  await new Promise(resolve => setTimeout(resolve, 2000));
+  await simulateWork(options, 2000);
 
   const result = await client.completeJob(jobHash, 'YOUR_WALLET_ADDRESS');
   return result;
@@ -348,12 +434,12 @@ export async function exampleGpuTrainingJob(client: FoundryClient, config: any):
  * 3D Printer Integration Example
  * Hooks into print completion
  */
-export async function example3DPrinterJob(client: FoundryClient, printJob: any): Promise<JobResult> {
+export async function example3DPrinterJob(client: FoundryClient, printJob: any, options: any = {}): Promise<JobResult> {
   const jobHash = client.generateJobHash('3d_print', printJob.file);
   await client.submitJob(jobHash, 1.2, { job_type: '3d_print', file: printJob.file });
 
   console.log(`[3D Printer] Printing: ${printJob.file}`);
-  await new Promise(resolve => setTimeout(resolve, 2500));
+  await simulateWork(options, 2500);
 
   const result = await client.completeJob(jobHash, printJob.wallet || 'YOUR_WALLET_ADDRESS');
   return result;
@@ -363,12 +449,12 @@ export async function example3DPrinterJob(client: FoundryClient, printJob: any):
  * CNC Machine Example
  * Rewards toolpath execution
  */
-export async function exampleCNCJob(client: FoundryClient, toolpath: any): Promise<JobResult> {
+export async function exampleCNCJob(client: FoundryClient, toolpath: any, options: any = {}): Promise<JobResult> {
   const jobHash = client.generateJobHash('cnc_job', toolpath.id);
   await client.submitJob(jobHash, 1.8, { job_type: 'cnc', steps: toolpath.steps });
 
   console.log(`[CNC] Executing toolpath: ${toolpath.id}`);
-  await new Promise(resolve => setTimeout(resolve, 1800));
+  await simulateWork(options, 1800);
 
   const result = await client.completeJob(jobHash, 'YOUR_WALLET_ADDRESS');
   return result;
@@ -378,12 +464,12 @@ export async function exampleCNCJob(client: FoundryClient, toolpath: any): Promi
  * Robot Task Example
  * Tracks autonomous robot work
  */
-export async function exampleRobotTask(client: FoundryClient, robotId: string, task: string): Promise<JobResult> {
+export async function exampleRobotTask(client: FoundryClient, robotId: string, task: string, options: any = {}): Promise<JobResult> {
   const jobHash = client.generateJobHash('robot_task', robotId);
   await client.submitJob(jobHash, 1.5, { job_type: 'robot', id: robotId, task });
 
   console.log(`[Robot] Executing task: ${task}`);
-  await new Promise(resolve => setTimeout(resolve, 1200));
+  await simulateWork(options, 1200);
 
   const result = await client.completeJob(jobHash, 'YOUR_WALLET_ADDRESS');
   return result;
@@ -393,12 +479,12 @@ export async function exampleRobotTask(client: FoundryClient, robotId: string, t
  * Simple On-Chain Verification Example
  * Rewards verification work
  */
-export async function exampleOnChainVerification(client: FoundryClient, txId: string): Promise<JobResult> {
+export async function exampleOnChainVerification(client: FoundryClient, txId: string, options: any = {}): Promise<JobResult> {
   const jobHash = client.generateJobHash('onchain_verify', txId);
   await client.submitJob(jobHash, 1.0, { job_type: 'verification', tx: txId });
 
   console.log(`[Verification] Verifying transaction: ${txId}`);
-  await new Promise(resolve => setTimeout(resolve, 500));
+  await simulateWork(options, 500);
 
   const result = await client.completeJob(jobHash, 'YOUR_WALLET_ADDRESS');
   return result;
@@ -408,14 +494,14 @@ export async function exampleOnChainVerification(client: FoundryClient, txId: st
  * Batch Data Processing Example
  * Rewards batch processing jobs
  */
-export async function exampleBatchProcessor(client: FoundryClient, batchSize: number): Promise<JobResult> {
+export async function exampleBatchProcessor(client: FoundryClient, batchSize: number, options: any = {}): Promise<JobResult> {
   const jobHash = client.generateJobHash('batch_process', `batch_${batchSize}`);
   const complexity = Math.min(2.0, 0.5 + (batchSize / 1000));
   await client.submitJob(jobHash, complexity, { job_type: 'batch', size: batchSize });
 
   console.log(`[Batch] Processing ${batchSize} items`);
   const processingTime = Math.min(5000, 100 + batchSize * 2);
-  await new Promise(resolve => setTimeout(resolve, processingTime));
+  await simulateWork(options, processingTime);
 
   const result = await client.completeJob(jobHash, 'YOUR_WALLET_ADDRESS');
   return result;
@@ -427,23 +513,20 @@ export async function exampleBatchProcessor(client: FoundryClient, batchSize: nu
  */
 export async function exampleMultiAgentCoordination(
   clients: FoundryClient[],
-  taskName: string
+  taskName: string,
+  options: any = {}
 ): Promise<JobResult[]> {
-  const results: JobResult[] = [];
-
-  for (let i = 0; i < clients.length; i++) {
-    const client = clients[i];
+  // Agents run concurrently: total latency is max(per-agent) instead of
+  // the sum of every submit + work + complete round-trip
+  return Promise.all(clients.map(async (client, i) => {
     const jobHash = client.generateJobHash('multi_agent', `${taskName}_agent_${i}`);
     await client.submitJob(jobHash, 1.0, { job_type: 'coordination', task: taskName, agent: i });
 
     console.log(`[Agent ${i}] Executing coordinated task`);
-    await new Promise(resolve => setTimeout(resolve, 600));
-
-    const result = await client.completeJob(jobHash, 'YOUR_WALLET_ADDRESS');
-    results.push(result);
-  }
+    await simulateWork(options, 600);
 
-  return results;
+    return client.completeJob(jobHash, 'YOUR_WALLET_ADDRESS');
+  }));
 }
 
 export default FoundryClient;
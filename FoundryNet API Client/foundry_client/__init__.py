@@ -1,4 +1,24 @@
-from .client import FoundryClient
+import importlib
 
 __version__ = "2.0.0"
-__all__ = ["FoundryClient"]
+
+# Lazy re-exports (PEP 562): importing foundry_client must not drag in
+# solders/solana/nacl/requests until the relevant class is touched
+_EXPORTS = {
+    "FoundryClient": "client",
+    "FoundryAPIClient": "api_client",
+    "FoundryAPIError": "api_client",
+    "TransientError": "api_client",
+    "PermanentError": "api_client",
+    "clear_credentials_cache": "api_client",
+    "AsyncFoundryAPIClient": "async_api_client",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,29 @@
+"""
+base58 helpers - prefer the Rust-backed `based58` package when installed
+(native word-at-a-time encode/decode), fall back to pure-Python `base58`.
+The backend loads lazily on first use to keep import time down.
+"""
+
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def _backend():
+    try:
+        import based58
+        return based58.b58encode, based58.b58decode, True
+    except ImportError:
+        import base58
+        return base58.b58encode, base58.b58decode, False
+
+
+def b58encode(data: bytes) -> bytes:
+    encode, _, _ = _backend()
+    return encode(data)
+
+
+def b58decode(data) -> bytes:
+    _, decode, is_rust = _backend()
+    if is_rust and isinstance(data, str):
+        data = data.encode()
+    return decode(data)
@@ -0,0 +1,736 @@
+"""
+FoundryNet API Client - HTTP interface to the FoundryNet backend
+Python port of foundry-client.js (Supabase Edge Functions API)
+"""
+
+import asyncio
+import functools
+import json
+import hashlib
+import os
+import random
+import ssl
+import tempfile
+import time
+from . import _b58
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+try:
+    import zstandard
+    _ZSTD = zstandard.ZstdCompressor(level=3)
+except ImportError:
+    _ZSTD = None
+
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+from uuid import uuid4
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+API_URL = "https://lsijwmklicmqtuqxhgnu.supabase.co/functions/v1/main-ts"
+DEFAULT_CREDENTIALS_FILE = ".foundry_credentials.json"
+
+MIN_COMPLEXITY = 0.5
+MAX_COMPLEXITY = 2.0
+COMPLEXITY_TOLERANCE = 0.01
+
+# Bodies above this size are worth compressing on the wire
+_COMPRESS_THRESHOLD = 1024
+
+# HTTP statuses worth retrying; anything else 4xx/5xx is deterministic
+_RETRYABLE_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+_BACKOFF_CAP = 30.0
+
+
+class FoundryAPIError(Exception):
+    """Base error for FoundryNet API failures."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class TransientError(FoundryAPIError):
+    """Retryable failure (timeout, rate limit, server error)."""
+
+
+class PermanentError(FoundryAPIError):
+    """Non-retryable failure (bad signature, missing job, etc.)."""
+
+
+def _http_error(status: int, message: str) -> FoundryAPIError:
+    if status in _RETRYABLE_STATUSES:
+        return TransientError(message, status=status)
+    return PermanentError(message, status=status)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to JSON bytes; orjson when available, stdlib otherwise."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_creds_cached(path: str, mtime_ns: int) -> dict:
+    # Keyed on mtime so an edited file is re-read, an unchanged one is not
+    return _json_loads(Path(path).read_bytes())
+
+
+@functools.lru_cache(maxsize=8)
+def _decode_signing_key(secret_key_base58: str):
+    import nacl.signing
+    return nacl.signing.SigningKey(_b58.b58decode(secret_key_base58))
+
+
+def clear_credentials_cache():
+    """Drop cached credential reads and decoded keys (used by tests)."""
+    _read_creds_cached.cache_clear()
+    _decode_signing_key.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _iso_second(secs: int) -> str:
+    # Cached per second - hot loops pay one strftime per second at most
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs))
+
+
+def _fast_iso() -> str:
+    """ISO-8601 UTC timestamp without constructing a datetime object."""
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_iso_second(secs)}.{ns // 1000:06d}"
+
+# One SSL context for the whole process - the CA chain is parsed once
+# and urllib3/aiohttp can resume TLS sessions across pooled connections
+_SSL_CTX = ssl.create_default_context()
+
+
+class FoundryAPIClient:
+    """
+    HTTP client for the FoundryNet backend API.
+
+    All methods block on network I/O. Do not call them from async
+    handlers - use AsyncFoundryAPIClient there, or wrap calls in
+    loop.run_in_executor().
+
+    Usage:
+        client = FoundryAPIClient()
+        client.init()
+
+        job_hash = client.generate_job_hash("some-task")
+        client.submit_job(job_hash, complexity=1.0)
+        client.complete_job(job_hash, "YOUR_WALLET_ADDRESS")
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        config = config or {}
+
+        self.api_url = config.get("api_url", API_URL)
+        self.retry_attempts = config.get("retry_attempts", 3)
+        self.retry_delay = config.get("retry_delay", 2.0)
+        self.debug = config.get("debug", False)
+        # Frozen at init so the disabled-path check is one set lookup
+        self._suppressed_levels = frozenset() if self.debug else frozenset({"debug"})
+        self.credentials_file = Path(config.get("credentials_file", DEFAULT_CREDENTIALS_FILE))
+
+        # Auto-batcher: queued submit_job calls are flushed as one /batch
+        # POST when the buffer fills or the flush interval elapses
+        self.max_batch_size = config.get("max_batch_size", 32)
+        self.flush_interval_ms = config.get("flush_interval_ms", 10)
+        self._pending_jobs: List[Dict] = []
+        self._pending_deadline: Optional[float] = None
+
+        # One keep-alive session for all calls - avoids a fresh TCP+TLS
+        # handshake per request in hot submit/complete loops
+        self._session = self._build_session()
+        self._is_httpx = type(self._session).__module__.startswith("httpx")
+
+        # Upload compression; flipped off if the backend rejects it (415)
+        self._compression_ok = _ZSTD is not None
+
+        # Endpoint URLs never change once api_url is known - build them
+        # once instead of per call
+        self._url_register = f"{self.api_url}/register-machine"
+        self._url_submit = f"{self.api_url}/submit-job"
+        self._url_complete = f"{self.api_url}/complete-job"
+        self._url_batch = f"{self.api_url}/batch"
+        self._url_job_details = f"{self.api_url}/job-details"
+        self._url_flag = f"{self.api_url}/flag-job"
+        self._url_metrics = f"{self.api_url}/metrics"
+
+        # Machine identity
+        self.machine_uuid: Optional[str] = None
+        self.signing_key = None  # nacl.signing.SigningKey
+        self.verify_key = None  # nacl.signing.VerifyKey
+
+        # Cached key encodings - the keys are fixed per process, so
+        # base58-encode them once instead of on every call
+        self._verify_key_bytes: Optional[bytes] = None
+        self._verify_key_b58: Optional[str] = None
+        self._signing_key_raw: Optional[bytes] = None
+        self._secret_key_b58: Optional[str] = None
+        self._sign = None
+        self._machine_uuid_bytes: Optional[bytes] = None
+
+    def _build_session(self):
+        # HTTP stacks are imported here, not at module load, so that
+        # importing foundry_client stays cheap on cold starts
+        import importlib.util
+
+        try:
+            import httpx
+        except ImportError:
+            httpx = None
+
+        # Only advertise codings the installed stack can decode; an
+        # undecodable response body is an error, not a fallback. brotli
+        # and zstandard are optional extras, gzip is always available.
+        accept_encoding = "gzip"
+        if (importlib.util.find_spec("brotli") is not None
+                or importlib.util.find_spec("brotlicffi") is not None):
+            accept_encoding += ", br"
+        if _ZSTD is not None:
+            accept_encoding += ", zstd"
+
+        if httpx is not None:
+            # HTTP/2 multiplexes concurrent requests over one TLS
+            # connection - no extra handshakes, no head-of-line blocking.
+            # It needs the optional h2 package (httpx[http2]); without it
+            # httpx.Client(http2=True) raises, so fall back to HTTP/1.1.
+            return httpx.Client(
+                http2=importlib.util.find_spec("h2") is not None,
+                verify=_SSL_CTX,
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept-Encoding": accept_encoding,
+                },
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=32),
+            )
+
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        class _SSLContextAdapter(HTTPAdapter):
+            def init_poolmanager(self, *args, **kwargs):
+                kwargs["ssl_context"] = _SSL_CTX
+                super().init_poolmanager(*args, **kwargs)
+
+        session = requests.Session()
+        session.headers["Content-Type"] = "application/json"
+        session.headers["Accept-Encoding"] = accept_encoding
+        session.mount("https://", _SSLContextAdapter(
+            pool_connections=4, pool_maxsize=16, max_retries=0
+        ))
+        session.mount("http://", HTTPAdapter(
+            pool_connections=4, pool_maxsize=16, max_retries=0
+        ))
+        return session
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self._session.close()
+
+    def _post(self, url: str, body: bytes, headers: Optional[Dict] = None):
+        if self._is_httpx:
+            return self._session.post(url, content=body, headers=headers)
+        return self._session.post(url, data=body, headers=headers)
+
+    def _get(self, url: str, params: Optional[Dict] = None):
+        return self._session.get(url, params=params)
+
+    # -----------------------------
+    # Logging
+    # -----------------------------
+
+    def log(self, level: str, message, data: Optional[Dict] = None):
+        """Log a message; `message` may be a zero-arg callable so hot
+        paths defer f-string formatting until the level is known live."""
+        if level in self._suppressed_levels:
+            return
+        if callable(message):
+            message = message()
+        timestamp = _fast_iso()
+        prefix = f"[FoundryNet] [{timestamp}] [{level.upper()}]"
+        if data:
+            print(f"{prefix} {message}", data)
+        else:
+            print(f"{prefix} {message}")
+
+    # -----------------------------
+    # Retry
+    # -----------------------------
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Capped exponential backoff with jitter to avoid retry storms."""
+        return min(_BACKOFF_CAP, self.retry_delay * 2 ** (attempt - 1)) * (0.5 + random.random())
+
+    def _request(self, method: str, url: str, obj=None, params: Optional[Dict] = None,
+                 context: str = "Request", error_prefix: Optional[str] = None,
+                 compress: bool = False, conflict_result: Optional[Dict] = None) -> Dict:
+        """
+        Run one endpoint call under the retry policy and return the parsed
+        JSON response. The loop is inlined here - callers pass plain
+        arguments instead of defining a per-call closure, so hot submit/
+        complete paths allocate no cell or code-object references.
+
+        `compress` routes the body through _post_body (zstd for large
+        payloads); `conflict_result`, when set, is returned on a 409
+        instead of raising (duplicate submissions are idempotent).
+        """
+        if error_prefix is None:
+            error_prefix = f"{context} failed"
+        last_error = None
+        for attempt in range(1, self.retry_attempts + 1):
+            try:
+                if method == "GET":
+                    r = self._get(url, params=params)
+                elif compress:
+                    r = self._post_body(url, obj)
+                else:
+                    r = self._post(url, _json_dumps(obj))
+                status = r.status_code
+                if status == 409 and conflict_result is not None:
+                    self.log("warn", "Job already exists", conflict_result)
+                    return conflict_result
+                if status >= 400:
+                    try:
+                        detail = _json_loads(r.content).get("error", r.text)
+                    except ValueError:
+                        detail = r.text
+                    raise _http_error(status, f"{error_prefix}: {detail}")
+                return _json_loads(r.content)
+            except PermanentError:
+                # Deterministic failure - retrying can never succeed
+                raise
+            except Exception as error:
+                last_error = error
+                self.log("warn", f"{context} failed (attempt {attempt}/{self.retry_attempts})", {
+                    "error": str(error)
+                })
+                if attempt < self.retry_attempts:
+                    delay = self._backoff_delay(attempt)
+                    try:
+                        asyncio.get_running_loop()
+                    except RuntimeError:
+                        pass
+                    else:
+                        self.log("warn", "Blocking retry inside a running event loop - "
+                                         "use AsyncFoundryAPIClient from async code")
+                    self.log("debug", lambda: f"Retrying in {delay:.2f}s...")
+                    time.sleep(delay)
+        self.log("error", f"{context} failed after {self.retry_attempts} attempts", {
+            "error": str(last_error)
+        })
+        raise last_error
+
+    # -----------------------------
+    # Identity Management
+    # -----------------------------
+
+    def _cache_key_encodings(self):
+        self._verify_key_bytes = bytes(self.verify_key)
+        self._verify_key_b58 = _b58.b58encode(self._verify_key_bytes).decode()
+        self._signing_key_raw = bytes(self.signing_key)
+        self._secret_key_b58 = _b58.b58encode(self._signing_key_raw).decode()
+        # Bound method cached so hot signing paths skip the per-call
+        # attribute lookup chain
+        self._sign = self.signing_key.sign
+
+    def generate_machine_id(self) -> Dict[str, str]:
+        """Generate new machine identity (UUID + Ed25519 keypair)."""
+        import nacl.signing
+
+        self.machine_uuid = str(uuid4())
+        self._machine_uuid_bytes = self.machine_uuid.encode()
+        self.signing_key = nacl.signing.SigningKey.generate()
+        self.verify_key = self.signing_key.verify_key
+        self._cache_key_encodings()
+
+        identity = {
+            "machine_uuid": self.machine_uuid,
+            "public_key": self._verify_key_b58,
+            "secret_key": self._secret_key_b58,
+        }
+
+        self.log("info", "Generated new machine identity", {
+            "machine_uuid": identity["machine_uuid"],
+            "public_key": identity["public_key"],
+        })
+
+        return identity
+
+    def load_machine_id(self, machine_uuid: str, secret_key_base58: str):
+        """Load an existing machine identity."""
+        try:
+            self.machine_uuid = machine_uuid
+            self._machine_uuid_bytes = machine_uuid.encode()
+            self.signing_key = _decode_signing_key(secret_key_base58)
+            self.verify_key = self.signing_key.verify_key
+            self._cache_key_encodings()
+            self.log("info", "Loaded machine identity", {"machine_uuid": machine_uuid})
+        except Exception as error:
+            self.log("error", "Failed to load machine identity", {"error": str(error)})
+            raise ValueError(f"Invalid machine credentials: {error}")
+
+    def save_credentials(self, identity: Dict[str, str]):
+        """Save machine credentials to disk."""
+        creds = {
+            "machine_uuid": identity["machine_uuid"],
+            "secret_key": identity["secret_key"],
+            "public_key": identity["public_key"],
+            "created_at": _fast_iso(),
+        }
+        # Compact JSON (the file is machine-read), written atomically so
+        # a crash mid-write can't corrupt the credentials
+        tmp = tempfile.NamedTemporaryFile(
+            dir=self.credentials_file.parent or ".", delete=False
+        )
+        try:
+            tmp.write(_json_dumps(creds))
+            tmp.close()
+            os.chmod(tmp.name, 0o600)
+            os.replace(tmp.name, self.credentials_file)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+        self.log("debug", lambda: f"Credentials saved to {self.credentials_file}")
+
+    def load_credentials(self) -> bool:
+        """Load existing machine credentials."""
+        try:
+            if self.credentials_file.exists():
+                st = self.credentials_file.stat()
+                creds = _read_creds_cached(str(self.credentials_file), st.st_mtime_ns)
+                self.load_machine_id(creds["machine_uuid"], creds["secret_key"])
+                self.log("info", "Loaded existing credentials", {
+                    "machine_uuid": self.machine_uuid
+                })
+                return True
+        except Exception:
+            self.log("debug", "No existing credentials found or corrupted")
+        return False
+
+    # -----------------------------
+    # Initialization
+    # -----------------------------
+
+    def init(self, metadata: Optional[Dict] = None) -> Dict:
+        """
+        Initialize the client: load or generate credentials, register if new.
+        """
+        if self.load_credentials():
+            self.log("info", "Using existing machine credentials", {
+                "machine_uuid": self.machine_uuid
+            })
+            return {"existing": True, "machine_uuid": self.machine_uuid or ""}
+
+        identity = self.generate_machine_id()
+        self.save_credentials(identity)
+
+        self.register_machine(metadata or {})
+
+        return {
+            "existing": False,
+            "identity": identity,
+            "machine_uuid": self.machine_uuid or "",
+        }
+
+    # -----------------------------
+    # Network Operations
+    # -----------------------------
+
+    def register_machine(self, metadata: Optional[Dict] = None) -> Dict:
+        """Register this machine with the backend."""
+        if not self.machine_uuid or not self.signing_key:
+            raise ValueError("Generate or load machine ID first")
+
+        result = self._request(
+            "POST", self._url_register,
+            obj={
+                "machine_uuid": self.machine_uuid,
+                "machine_pubkey_base58": self._verify_key_b58,
+                "metadata": metadata or {},
+            },
+            context="Machine registration",
+            error_prefix="Registration failed",
+        )
+        self.log("info", "Machine registered successfully", {
+            "machine_uuid": self.machine_uuid
+        })
+        return result
+
+    def _encode_body(self, obj) -> tuple:
+        """Serialize a request body, zstd-compressing large payloads.
+
+        Returns (bytes, extra_headers_or_None).
+        """
+        body = _json_dumps(obj)
+        if self._compression_ok and len(body) > _COMPRESS_THRESHOLD:
+            return _ZSTD.compress(body), {"Content-Encoding": "zstd"}
+        return body, None
+
+    def _post_body(self, url: str, obj):
+        """POST a body with optional compression, falling back on 415."""
+        body, headers = self._encode_body(obj)
+        r = self._post(url, body, headers=headers)
+        if headers and r.status_code == 415:
+            # Backend doesn't take compressed bodies - disable and resend
+            self._compression_ok = False
+            r = self._post(url, _json_dumps(obj))
+        return r
+
+    @staticmethod
+    def _normalize_complexity(complexity: float) -> float:
+        normalized = round(complexity * 100) / 100
+        if (normalized < MIN_COMPLEXITY - COMPLEXITY_TOLERANCE
+                or normalized > MAX_COMPLEXITY + COMPLEXITY_TOLERANCE):
+            raise ValueError(
+                f"Complexity must be {MIN_COMPLEXITY}-{MAX_COMPLEXITY}, got {normalized}"
+            )
+        return normalized
+
+    def submit_job(self, job_hash: str, complexity: float = 1.0,
+                   payload: Optional[Dict] = None) -> Dict:
+        """Submit a job for tracking."""
+        if not self.machine_uuid:
+            raise ValueError("Machine not initialized")
+
+        normalized = self._normalize_complexity(complexity)
+
+        result = self._request(
+            "POST", self._url_submit,
+            obj={
+                "machine_uuid": self.machine_uuid,
+                "job_hash": job_hash,
+                "complexity": normalized,
+                "payload": payload or {},
+            },
+            context="Job submission",
+            compress=True,
+            conflict_result={"success": True, "duplicate": True, "job_hash": job_hash},
+        )
+        if not result.get("duplicate"):
+            self.log("debug", lambda: f"Job submitted {job_hash} (complexity {normalized})")
+        return result
+
+    def complete_job(self, job_hash: str, recipient_wallet: str) -> Dict:
+        """Complete a job with a signed proof; triggers MINT settlement."""
+        if not self.machine_uuid or not self.signing_key:
+            raise ValueError("Machine not initialized")
+
+        timestamp = _fast_iso()
+        message = b"|".join([
+            job_hash.encode(), recipient_wallet.encode(), timestamp.encode(),
+        ])
+        signature = self._sign(message).signature
+
+        result = self._request(
+            "POST", self._url_complete,
+            obj={
+                "machine_uuid": self.machine_uuid,
+                "job_hash": job_hash,
+                "recipient_wallet": recipient_wallet,
+                "completion_proof": {
+                    "timestamp": timestamp,
+                    "signature_base58": _b58.b58encode(signature).decode(),
+                },
+            },
+            context="Job completion",
+        )
+        self.log("info", "Job completed - MINT earned!", {
+            "job_hash": job_hash,
+            "reward": result.get("reward_net"),
+            "tx_signature": result.get("tx_signature"),
+        })
+        return result
+
+    # -----------------------------
+    # Batch Operations
+    # -----------------------------
+
+    def _post_batch(self, ops: List[Dict]) -> List[Dict]:
+        """POST a list of {method, path, body} ops to the /batch endpoint."""
+        result = self._request(
+            "POST", self._url_batch,
+            obj={"requests": ops},
+            context="Batch request",
+            compress=True,
+        )
+        return result.get("responses", [])
+
+    def _submit_batch_ops(self, jobs: List[Dict]) -> List[Dict]:
+        """Build the /submit-job ops for a batch (shared with async)."""
+        if not self.machine_uuid:
+            raise ValueError("Machine not initialized")
+
+        return [{
+            "method": "POST",
+            "path": "/submit-job",
+            "body": {
+                "machine_uuid": self.machine_uuid,
+                "job_hash": job["job_hash"],
+                "complexity": self._normalize_complexity(job.get("complexity", 1.0)),
+                "payload": job.get("payload") or {},
+            },
+        } for job in jobs]
+
+    def _complete_batch_ops(self, entries: List[Dict]) -> List[Dict]:
+        """Build and sign the /complete-job ops for a batch (shared with async)."""
+        if not self.machine_uuid or not self.signing_key:
+            raise ValueError("Machine not initialized")
+
+        # Structure-of-arrays: build all messages, sign in one tight loop
+        # over the pre-bound signer, then encode all signatures at once
+        sign = self._sign
+        timestamp = _fast_iso()
+        timestamp_bytes = timestamp.encode()
+        messages = [
+            b"|".join([
+                entry["job_hash"].encode(),
+                entry["recipient_wallet"].encode(), timestamp_bytes,
+            ])
+            for entry in entries
+        ]
+        signatures = [sign(message).signature for message in messages]
+        signatures_b58 = [sig.decode() for sig in map(_b58.b58encode, signatures)]
+
+        return [{
+            "method": "POST",
+            "path": "/complete-job",
+            "body": {
+                "machine_uuid": self.machine_uuid,
+                "job_hash": entry["job_hash"],
+                "recipient_wallet": entry["recipient_wallet"],
+                "completion_proof": {
+                    "timestamp": timestamp,
+                    "signature_base58": sig_b58,
+                },
+            },
+        } for entry, sig_b58 in zip(entries, signatures_b58)]
+
+    def submit_jobs_batch(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Submit many jobs in one HTTPS call. Each entry is a dict of
+        submit_job kwargs, e.g. {"job_hash": ..., "complexity": 1.2}.
+        """
+        results = self._post_batch(self._submit_batch_ops(jobs))
+        self.log("debug", lambda: f"Job batch submitted ({len(results)} jobs)")
+        return results
+
+    def complete_jobs_batch(self, entries: List[Dict]) -> List[Dict]:
+        """
+        Complete many jobs in one HTTPS call. Each entry is
+        {"job_hash": ..., "recipient_wallet": ...}. Proofs are signed
+        upfront so the batch is a single round-trip.
+        """
+        ops = self._complete_batch_ops(entries)
+        results = self._post_batch(ops)
+        self.log("info", "Job batch completed", {"count": len(ops)})
+        return results
+
+    def complete_jobs(self, entries: List[tuple]) -> List[Dict]:
+        """Complete many jobs from (job_hash, recipient_wallet) pairs."""
+        return self.complete_jobs_batch([
+            {"job_hash": job_hash, "recipient_wallet": wallet}
+            for job_hash, wallet in entries
+        ])
+
+    def queue_job(self, job_hash: str, complexity: float = 1.0,
+                  payload: Optional[Dict] = None) -> Optional[List[Dict]]:
+        """
+        Buffer a submit_job call for the auto-batcher. Returns the batch
+        results when the buffer flushes (full or flush_interval_ms old),
+        otherwise None. Call flush_jobs() to force out a partial buffer.
+        """
+        now = time.monotonic()
+        if not self._pending_jobs:
+            self._pending_deadline = now + self.flush_interval_ms / 1000.0
+        self._pending_jobs.append({
+            "job_hash": job_hash, "complexity": complexity, "payload": payload
+        })
+
+        if len(self._pending_jobs) >= self.max_batch_size or now >= self._pending_deadline:
+            return self.flush_jobs()
+        return None
+
+    def flush_jobs(self) -> List[Dict]:
+        """Flush any buffered submit_job calls as one batch."""
+        if not self._pending_jobs:
+            return []
+        jobs, self._pending_jobs = self._pending_jobs, []
+        self._pending_deadline = None
+        return self.submit_jobs_batch(jobs)
+
+    def get_job_details(self, job_hash: str) -> Dict:
+        """Fetch details for a submitted job."""
+        return self._request(
+            "GET", self._url_job_details,
+            params={"job_hash": job_hash},
+            context="Fetch job details",
+            error_prefix="Failed to fetch job details",
+        )
+
+    def flag_job(self, job_hash: str, reason: str) -> Dict:
+        """Flag a job for review."""
+        if not self.machine_uuid:
+            raise ValueError("Machine not initialized")
+
+        return self._request(
+            "POST", self._url_flag,
+            obj={
+                "machine_uuid": self.machine_uuid,
+                "job_hash": job_hash,
+                "reason": reason,
+            },
+            context="Flag job",
+            error_prefix="Failed to flag job",
+        )
+
+    def get_metrics(self) -> Dict:
+        """Fetch network-wide metrics."""
+        return self._request(
+            "GET", self._url_metrics,
+            context="Fetch metrics",
+            error_prefix="Failed to fetch metrics",
+        )
+
+    # -----------------------------
+    # Helpers
+    # -----------------------------
+
+    def generate_job_hash(self, filename: str, additional_data: str = "") -> str:
+        """Generate a unique job hash."""
+        now_ms = int(time.time() * 1000)
+        uuid_bytes = self._machine_uuid_bytes or b"unknown"
+        data = b"|".join([
+            uuid_bytes, filename.encode(), str(now_ms).encode(), additional_data.encode()
+        ])
+        if _blake3 is not None:
+            # 8 bytes -> the same 16 hex chars, no slice needed
+            digest = _blake3(data).hexdigest(length=8)
+        else:
+            digest = hashlib.sha256(data).hexdigest()[:16]
+        return f"job_{digest}_{now_ms}"
+
+    def get_machine_uuid(self) -> str:
+        return self.machine_uuid or ""
+
+    def get_public_key(self) -> str:
+        return self._verify_key_b58 or ""
@@ -0,0 +1,350 @@
+"""
+FoundryNet API Client - async variant
+Same API surface as FoundryAPIClient, on asyncio + aiohttp
+"""
+
+import asyncio
+from . import _b58
+from typing import Dict, List, Optional
+
+from .api_client import (
+    FoundryAPIClient,
+    PermanentError,
+    _fast_iso,
+    _http_error,
+    _json_dumps,
+    _json_loads,
+)
+
+
+class AsyncFoundryAPIClient(FoundryAPIClient):
+    """
+    Async FoundryNet client. All network methods are coroutines, so N
+    submissions via submit_many() take max(RTT) instead of sum(RTT).
+
+    Usage:
+        client = AsyncFoundryAPIClient()
+        client.init_credentials()
+
+        await client.submit_job(job_hash, complexity=1.0)
+        await client.complete_job(job_hash, "YOUR_WALLET_ADDRESS")
+        await client.close()
+
+    Requires aiohttp (pip install aiohttp).
+    """
+
+    # Auto-batcher flush timer; armed when the first job is buffered
+    _flush_task = None
+
+    def _build_session(self):
+        # aiohttp sessions must be created inside a running event loop;
+        # built lazily in _get_session() instead
+        return None
+
+    def _get_session(self):
+        if self._session is None:
+            import aiohttp
+            from .api_client import _SSL_CTX
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(ssl=_SSL_CTX, limit=32),
+                headers={"Content-Type": "application/json"},
+            )
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    # -----------------------------
+    # Retry
+    # -----------------------------
+
+    async def _retry(self, fn, context: str = ""):
+        last_error = None
+        for attempt in range(1, self.retry_attempts + 1):
+            try:
+                return await fn()
+            except PermanentError:
+                # Deterministic failure - retrying can never succeed
+                raise
+            except Exception as error:
+                last_error = error
+                self.log("warn", f"{context} failed (attempt {attempt}/{self.retry_attempts})", {
+                    "error": str(error)
+                })
+                if attempt < self.retry_attempts:
+                    delay = self._backoff_delay(attempt)
+                    self.log("debug", lambda: f"Retrying in {delay:.2f}s...")
+                    await asyncio.sleep(delay)
+        self.log("error", f"{context} failed after {self.retry_attempts} attempts", {
+            "error": str(last_error)
+        })
+        raise last_error
+
+    # -----------------------------
+    # Initialization
+    # -----------------------------
+
+    def init_credentials(self) -> Dict:
+        """
+        Load or generate machine credentials (synchronous - local disk only).
+        New machines still need an awaited register_machine() call.
+        """
+        if self.load_credentials():
+            self.log("info", "Using existing machine credentials", {
+                "machine_uuid": self.machine_uuid
+            })
+            return {"existing": True, "machine_uuid": self.machine_uuid or ""}
+
+        identity = self.generate_machine_id()
+        self.save_credentials(identity)
+        return {
+            "existing": False,
+            "identity": identity,
+            "machine_uuid": self.machine_uuid or "",
+        }
+
+    async def init(self, metadata: Optional[Dict] = None) -> Dict:
+        """Initialize the client: load or generate credentials, register if new."""
+        result = self.init_credentials()
+        if not result["existing"]:
+            await self.register_machine(metadata or {})
+        return result
+
+    # -----------------------------
+    # Network Operations
+    # -----------------------------
+
+    async def register_machine(self, metadata: Optional[Dict] = None) -> Dict:
+        """Register this machine with the backend."""
+        if not self.machine_uuid or not self.signing_key:
+            raise ValueError("Generate or load machine ID first")
+
+        async def _register():
+            session = self._get_session()
+            async with session.post(
+                self._url_register,
+                data=_json_dumps({
+                    "machine_uuid": self.machine_uuid,
+                    "machine_pubkey_base58": self._verify_key_b58,
+                    "metadata": metadata or {},
+                }),
+            ) as r:
+                if r.status >= 400:
+                    raise _http_error(r.status, f"Registration failed: {await r.text()}")
+                result = _json_loads(await r.read())
+            self.log("info", "Machine registered successfully", {
+                "machine_uuid": self.machine_uuid
+            })
+            return result
+
+        return await self._retry(_register, "Machine registration")
+
+    async def submit_job(self, job_hash: str, complexity: float = 1.0,
+                         payload: Optional[Dict] = None) -> Dict:
+        """Submit a job for tracking."""
+        if not self.machine_uuid:
+            raise ValueError("Machine not initialized")
+
+        normalized = self._normalize_complexity(complexity)
+
+        async def _submit():
+            session = self._get_session()
+            async with session.post(
+                self._url_submit,
+                data=_json_dumps({
+                    "machine_uuid": self.machine_uuid,
+                    "job_hash": job_hash,
+                    "complexity": normalized,
+                    "payload": payload or {},
+                }),
+            ) as r:
+                if r.status == 409:
+                    self.log("warn", "Job already exists", {"job_hash": job_hash})
+                    return {"success": True, "duplicate": True, "job_hash": job_hash}
+                if r.status >= 400:
+                    raise _http_error(r.status, f"Job submission failed: {await r.text()}")
+                result = _json_loads(await r.read())
+            self.log("debug", lambda: f"Job submitted {job_hash} (complexity {normalized})")
+            return result
+
+        return await self._retry(_submit, "Job submission")
+
+    async def submit_many(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Submit many jobs concurrently. Each entry is a dict of
+        submit_job kwargs, e.g. {"job_hash": ..., "complexity": 1.2}.
+        """
+        return await asyncio.gather(*(self.submit_job(**job) for job in jobs))
+
+    async def complete_job(self, job_hash: str, recipient_wallet: str) -> Dict:
+        """Complete a job with a signed proof; triggers MINT settlement."""
+        if not self.machine_uuid or not self.signing_key:
+            raise ValueError("Machine not initialized")
+
+        timestamp = _fast_iso()
+        message = b"|".join([
+            job_hash.encode(), recipient_wallet.encode(), timestamp.encode(),
+        ])
+        signature = self._sign(message).signature
+
+        async def _complete():
+            session = self._get_session()
+            async with session.post(
+                self._url_complete,
+                data=_json_dumps({
+                    "machine_uuid": self.machine_uuid,
+                    "job_hash": job_hash,
+                    "recipient_wallet": recipient_wallet,
+                    "completion_proof": {
+                        "timestamp": timestamp,
+                        "signature_base58": _b58.b58encode(signature).decode(),
+                    },
+                }),
+            ) as r:
+                if r.status >= 400:
+                    raise _http_error(r.status, f"Job completion failed: {await r.text()}")
+                result = _json_loads(await r.read())
+            self.log("info", "Job completed - MINT earned!", {
+                "job_hash": job_hash,
+                "reward": result.get("reward_net"),
+                "tx_signature": result.get("tx_signature"),
+            })
+            return result
+
+        return await self._retry(_complete, "Job completion")
+
+    # -----------------------------
+    # Batch Operations
+    # -----------------------------
+
+    async def _post_batch(self, ops: List[Dict]) -> List[Dict]:
+        """POST a list of {method, path, body} ops to the /batch endpoint."""
+        async def _batch():
+            session = self._get_session()
+            body, headers = self._encode_body({"requests": ops})
+            async with session.post(self._url_batch, data=body, headers=headers) as r:
+                if not (headers and r.status == 415):
+                    if r.status >= 400:
+                        raise _http_error(r.status, f"Batch request failed: {await r.text()}")
+                    return _json_loads(await r.read()).get("responses", [])
+            # Backend doesn't take compressed bodies - disable and resend
+            self._compression_ok = False
+            async with session.post(self._url_batch, data=_json_dumps({"requests": ops})) as r:
+                if r.status >= 400:
+                    raise _http_error(r.status, f"Batch request failed: {await r.text()}")
+                return _json_loads(await r.read()).get("responses", [])
+
+        return await self._retry(_batch, "Batch request")
+
+    async def submit_jobs_batch(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Submit many jobs in one HTTPS call. Each entry is a dict of
+        submit_job kwargs, e.g. {"job_hash": ..., "complexity": 1.2}.
+        """
+        results = await self._post_batch(self._submit_batch_ops(jobs))
+        self.log("debug", lambda: f"Job batch submitted ({len(results)} jobs)")
+        return results
+
+    async def complete_jobs_batch(self, entries: List[Dict]) -> List[Dict]:
+        """
+        Complete many jobs in one HTTPS call. Each entry is
+        {"job_hash": ..., "recipient_wallet": ...}. Proofs are signed
+        upfront so the batch is a single round-trip.
+        """
+        ops = self._complete_batch_ops(entries)
+        results = await self._post_batch(ops)
+        self.log("info", "Job batch completed", {"count": len(ops)})
+        return results
+
+    async def complete_jobs(self, entries: List[tuple]) -> List[Dict]:
+        """Complete many jobs from (job_hash, recipient_wallet) pairs."""
+        return await self.complete_jobs_batch([
+            {"job_hash": job_hash, "recipient_wallet": wallet}
+            for job_hash, wallet in entries
+        ])
+
+    async def queue_job(self, job_hash: str, complexity: float = 1.0,
+                        payload: Optional[Dict] = None) -> Optional[List[Dict]]:
+        """
+        Buffer a submit_job call for the auto-batcher. Returns the batch
+        results when the buffer fills, otherwise None. A partial buffer
+        flushes on its own after flush_interval_ms - unlike the sync
+        client, the running loop lets us schedule that instead of
+        waiting for the next queue_job call.
+        """
+        if not self._pending_jobs:
+            # First buffered job arms the flush timer
+            self._flush_task = asyncio.get_running_loop().create_task(
+                self._delayed_flush()
+            )
+        self._pending_jobs.append({
+            "job_hash": job_hash, "complexity": complexity, "payload": payload
+        })
+
+        if len(self._pending_jobs) >= self.max_batch_size:
+            return await self.flush_jobs()
+        return None
+
+    async def _delayed_flush(self):
+        await asyncio.sleep(self.flush_interval_ms / 1000.0)
+        self._flush_task = None
+        await self.flush_jobs()
+
+    async def flush_jobs(self) -> List[Dict]:
+        """Flush any buffered submit_job calls as one batch."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if not self._pending_jobs:
+            return []
+        jobs, self._pending_jobs = self._pending_jobs, []
+        return await self.submit_jobs_batch(jobs)
+
+    async def get_job_details(self, job_hash: str) -> Dict:
+        """Fetch details for a submitted job."""
+        async def _details():
+            session = self._get_session()
+            async with session.get(
+                self._url_job_details,
+                params={"job_hash": job_hash},
+            ) as r:
+                if r.status >= 400:
+                    raise _http_error(r.status, f"Failed to fetch job details: {await r.text()}")
+                return _json_loads(await r.read())
+
+        return await self._retry(_details, "Fetch job details")
+
+    async def flag_job(self, job_hash: str, reason: str) -> Dict:
+        """Flag a job for review."""
+        if not self.machine_uuid:
+            raise ValueError("Machine not initialized")
+
+        async def _flag():
+            session = self._get_session()
+            async with session.post(
+                self._url_flag,
+                data=_json_dumps({
+                    "machine_uuid": self.machine_uuid,
+                    "job_hash": job_hash,
+                    "reason": reason,
+                }),
+            ) as r:
+                if r.status >= 400:
+                    raise _http_error(r.status, f"Failed to flag job: {await r.text()}")
+                return _json_loads(await r.read())
+
+        return await self._retry(_flag, "Flag job")
+
+    async def get_metrics(self) -> Dict:
+        """Fetch network-wide metrics."""
+        async def _metrics():
+            session = self._get_session()
+            async with session.get(self._url_metrics) as r:
+                if r.status >= 400:
+                    raise _http_error(r.status, "Failed to fetch metrics")
+                return _json_loads(await r.read())
+
+        return await self._retry(_metrics, "Fetch metrics")
@@ -6,7 +6,8 @@ No intermediary backend - talks directly to the Solana program
 import json
 import hashlib
 import os
-import base58
+import tempfile
+from . import _b58
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
@@ -100,7 +101,7 @@ class FoundryClient:
         
         identity = {
             "public_key": str(self.machine_keypair.pubkey()),
-            "secret_key": base58.b58encode(bytes(self.machine_keypair)).decode(),
+            "secret_key": _b58.b58encode(bytes(self.machine_keypair)).decode(),
             "created_at": datetime.utcnow().isoformat(),
         }
         
@@ -115,9 +116,17 @@ class FoundryClient:
         self.credential_dir.mkdir(parents=True, exist_ok=True)
         path = self._credential_path()
         
-        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-        with os.fdopen(fd, "w") as f:
-            json.dump(identity, f, indent=2)
+        # Compact JSON (the file is machine-read), written atomically so
+        # a crash mid-write can't corrupt the credentials
+        tmp = tempfile.NamedTemporaryFile(dir=self.credential_dir, delete=False)
+        try:
+            tmp.write(json.dumps(identity).encode())
+            tmp.close()
+            os.chmod(tmp.name, 0o600)
+            os.replace(tmp.name, path)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
         
         self.log("debug", "Credentials saved", {"path": str(path)})
     
@@ -132,7 +141,7 @@ class FoundryClient:
             creds = json.load(f)
         
         self.machine_keypair = Keypair.from_bytes(
-            base58.b58decode(creds["secret_key"])
+            _b58.b58decode(creds["secret_key"])
         )
         
         self.log("info", "Loaded existing credentials", {
@@ -18,5 +18,11 @@ setup(
         "solders>=0.20.0",
         "base58>=2.1.1",
         "requests>=2.31.0",
+        "PyNaCl>=1.5.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.9.0"],
+        "http2": ["httpx[http2]>=0.24.0"],
+        "fast": ["based58>=0.1.1", "orjson>=3.9.0", "blake3>=0.4.0", "zstandard>=0.22.0"],
+    },
 )
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """MINTWorker - Autonomous MINT-earning agent for Raspberry Pi"""
 
+import asyncio
 import os
 import sys
 import json
@@ -10,10 +11,14 @@ import hashlib
 import logging
 import requests
 from pathlib import Path
-from datetime import datetime, timedelta
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from foundry_mint import MINTAgent
+from foundry_mint import MINTAgent, RecordWorkError
 
 CONFIG = {
     "llm_api_key": os.environ.get("OPENROUTER_API_KEY", ""),
@@ -26,74 +31,109 @@ CONFIG = {
 logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(message)s')
 log = logging.getLogger("MINTWorker")
 
-TEMPLATES = [
-    "Status: {balance:.2f} MINT earned. Wallet: {wallet}\nhttps://solscan.io/account/{wallet}",
-    "Just earned {earn:.2f} MINT. Rate: 0.005/sec. Any agent can do this.\npip install foundry-mint",
-    "The bootstrap problem: Agents can spend but can't earn. MINT fixes this.\nhttps://foundrynet.io",
-]
+# f-string callables instead of .format templates - the format spec is
+# compiled to bytecode once rather than re-parsed every post
+TEMPLATES = (
+    lambda balance, wallet, earn: f"Status: {balance:.2f} MINT earned. Wallet: {wallet}\nhttps://solscan.io/account/{wallet}",
+    lambda balance, wallet, earn: f"Just earned {earn:.2f} MINT. Rate: 0.005/sec. Any agent can do this.\npip install foundry-mint",
+    lambda balance, wallet, earn: "The bootstrap problem: Agents can spend but can't earn. MINT fixes this.\nhttps://foundrynet.io",
+)
 
 def load_state():
     CONFIG["state_file"].parent.mkdir(parents=True, exist_ok=True)
     if CONFIG["state_file"].exists():
-        return json.load(open(CONFIG["state_file"]))
+        with open(CONFIG["state_file"], "rb") as f:
+            data = f.read()
+        state = orjson.loads(data) if orjson else json.loads(data)
+        if isinstance(state.get("last_post"), str):
+            # Migrate old states that stored an ISO timestamp string
+            from datetime import datetime, timezone
+            state["last_post"] = (
+                datetime.fromisoformat(state["last_post"])
+                .replace(tzinfo=timezone.utc).timestamp()
+            )
+        return state
     return {"last_post": None, "jobs": 0, "posts": 0}
 
 def save_state(state):
-    json.dump(state, open(CONFIG["state_file"], "w"), indent=2)
+    # Write-then-rename so a crash mid-write can't corrupt the state file;
+    # compact JSON since the file is only machine-read
+    path = CONFIG["state_file"]
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "wb") as f:
+        f.write(orjson.dumps(state) if orjson else json.dumps(state).encode())
+    os.replace(tmp, path)
 
-def run_cycle(state, mint):
+async def run_cycle(state, mint, record):
     start = time.time()
     log.info("=== Cycle Start ===")
-    
-    balance = mint.get_mint_balance()
+
+    # One batched RPC covers blockhash + balance instead of separate calls
+    snapshot = await mint.cycle_snapshot()
+    balance = snapshot["balance"]
     log.info(f"Balance: {balance:.4f} MINT")
     
-    # Post if cooldown passed
-    can_post = True
-    if state.get("last_post"):
-        elapsed = datetime.utcnow() - datetime.fromisoformat(state["last_post"])
-        can_post = elapsed > timedelta(minutes=CONFIG["post_cooldown_minutes"])
-    
+    # Post if cooldown passed - last_post is a plain time.time() float,
+    # so the check is one subtraction instead of ISO parsing
+    now = time.time()
+    can_post = (
+        not state.get("last_post")
+        or now - state["last_post"] > CONFIG["post_cooldown_minutes"] * 60
+    )
+
     if can_post:
-        content = random.choice(TEMPLATES).format(
-            balance=balance, wallet=mint.wallet_address, earn=0.3
-        )
+        content = random.choice(TEMPLATES)(balance, mint.wallet_address, 0.3)
         log.info(f"Would post: {content[:100]}...")
         state["posts"] = state.get("posts", 0) + 1
-        state["last_post"] = datetime.utcnow().isoformat()
+        state["last_post"] = now
     
     # Record work
     duration = max(30, int(time.time() - start))
     try:
-        sig = mint.record_work(f"cycle_{datetime.utcnow():%Y%m%d_%H%M}", duration)
+        sig = await record(
+            f"cycle_{time.strftime('%Y%m%d_%H%M', time.gmtime())}", duration,
+            blockhash=snapshot["blockhash"],
+        )
         log.info(f"Earned! https://solscan.io/tx/{sig}")
         state["jobs"] = state.get("jobs", 0) + 1
-    except Exception as e:
+    except RecordWorkError as e:
+        # Retries already happened inside the SDK - just pick it up
+        # again next cycle instead of oversleeping
         log.error(f"Record failed: {e}")
     
     return state
 
-def main():
+async def main_async():
     log.info("MINTWorker starting")
-    
+
     mint = MINTAgent(debug=True)
-    result = mint.init()
+    result = await mint.init()
     log.info(f"Wallet: {result['wallet_address']}")
-    
+
     state = load_state()
-    
+    # Every cycle records at the default complexity; specialize once
+    record = mint.specialize(complexity=1.0)
+
     while True:
         try:
-            state = run_cycle(state, mint)
+            state = await run_cycle(state, mint, record)
             save_state(state)
             log.info(f"Sleeping {CONFIG['cycle_interval_minutes']}min...")
-            time.sleep(CONFIG["cycle_interval_minutes"] * 60)
-        except KeyboardInterrupt:
+            await asyncio.sleep(CONFIG["cycle_interval_minutes"] * 60)
+        except (KeyboardInterrupt, asyncio.CancelledError):
             save_state(state)
             break
         except Exception as e:
             log.error(f"Error: {e}")
-            time.sleep(300)
+            await asyncio.sleep(300)
+
+    await mint.close()
+
+def main():
+    try:
+        asyncio.run(main_async())
+    except KeyboardInterrupt:
+        pass
 
 if __name__ == "__main__":
     main()
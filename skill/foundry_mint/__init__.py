@@ -3,37 +3,94 @@ MINT Protocol SDK - Earn tokens for your work
 
 Usage:
     from foundry_mint import MINTAgent
-    
+
     agent = MINTAgent()
-    agent.init()
-    
+    await agent.init()
+
     # After any task
-    agent.record_work("task description", duration_seconds=120)
+    await agent.record_work("task description", duration_seconds=120)
+
+Synchronous scripts can use the quick_record() helper instead.
 """
 
+from __future__ import annotations
+
+import asyncio
+import base64
 import json
 import hashlib
 import os
+import random
+import struct
 import time
 from pathlib import Path
 from typing import Optional
 
-from solders.keypair import Keypair
-from solders.pubkey import Pubkey
-from solders.system_program import ID as SYSTEM_PROGRAM_ID
-from solders.transaction import Transaction
-from solders.message import Message
-from solders.instruction import Instruction, AccountMeta
-from solana.rpc.api import Client
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
 
 __version__ = "1.0.0"
 
-# Protocol constants
-PROGRAM_ID = Pubkey.from_string("4ZvTZ3skfeMF3ZGyABoazPa9tiudw2QSwuVKn45t2AKL")
-STATE_ACCOUNT = Pubkey.from_string("2Lm7hrtqK9W5tykVu4U37nUNJiiFh6WQ1rD8ZJWXomr2")
+# Protocol constants (base58; the Pubkey forms are resolved lazily)
+_PROGRAM_ID = "4ZvTZ3skfeMF3ZGyABoazPa9tiudw2QSwuVKn45t2AKL"
+_STATE_ACCOUNT = "2Lm7hrtqK9W5tykVu4U37nUNJiiFh6WQ1rD8ZJWXomr2"
 MINT_TOKEN = "5Pd4YBgFdih88vAFGAEEsk2JpixrZDJpRynTWvqPy5da"
 RPC_URL = "https://api.mainnet-beta.solana.com"
-ORACLE_PUBKEY = Pubkey.from_string("7SgQbwxFMTJcTNkQ8uQB1YLnodJtgWkfej3p4aTv3bHD")
+_ORACLE_PUBKEY = "7SgQbwxFMTJcTNkQ8uQB1YLnodJtgWkfej3p4aTv3bHD"
+
+_CHAIN_LOADED = False
+
+
+def _load_chain():
+    """
+    Import the heavy solders/solana/httpx stack and resolve the Pubkey
+    constants. Deferred until the first MINTAgent is constructed:
+    importing solana alone pulls in websockets, httpx and friends -
+    several hundred ms on the Raspberry Pi targets - which a bare
+    `import foundry_mint` never needs to pay.
+    """
+    global _CHAIN_LOADED, httpx, Hash, Keypair, Pubkey, SYSTEM_PROGRAM_ID
+    global Transaction, Message, Instruction, AccountMeta, AsyncClient
+    global get_associated_token_address
+    global PROGRAM_ID, STATE_ACCOUNT, ORACLE_PUBKEY, MINT_TOKEN_PUBKEY
+    if _CHAIN_LOADED:
+        return
+
+    import httpx
+    from solders.hash import Hash
+    from solders.keypair import Keypair
+    from solders.pubkey import Pubkey
+    from solders.system_program import ID as SYSTEM_PROGRAM_ID
+    from solders.transaction import Transaction
+    from solders.message import Message
+    from solders.instruction import Instruction, AccountMeta
+    from solana.rpc.async_api import AsyncClient
+    from spl.token.instructions import get_associated_token_address
+
+    PROGRAM_ID = Pubkey.from_string(_PROGRAM_ID)
+    STATE_ACCOUNT = Pubkey.from_string(_STATE_ACCOUNT)
+    ORACLE_PUBKEY = Pubkey.from_string(_ORACLE_PUBKEY)
+    MINT_TOKEN_PUBKEY = Pubkey.from_string(MINT_TOKEN)
+    _CHAIN_LOADED = True
+
+
+# Chain-stack names (classes and resolved Pubkey constants) keep working
+# as module attributes; touching one triggers the deferred import
+_LAZY_CHAIN_ATTRS = frozenset({
+    "httpx", "Hash", "Keypair", "Pubkey", "SYSTEM_PROGRAM_ID",
+    "Transaction", "Message", "Instruction", "AccountMeta", "AsyncClient",
+    "get_associated_token_address",
+    "PROGRAM_ID", "STATE_ACCOUNT", "ORACLE_PUBKEY", "MINT_TOKEN_PUBKEY",
+})
+
+
+def __getattr__(name):
+    if name in _LAZY_CHAIN_ATTRS:
+        _load_chain()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Anchor discriminators
 DISCRIMINATORS = {
@@ -41,27 +98,102 @@ DISCRIMINATORS = {
     "record_job": bytes([54, 124, 168, 158, 236, 237, 107, 206]),
 }
 
+# record_job data layout: discriminator, hash length, 20-byte hash,
+# duration (u64), complexity (u32) - packed in one shot instead of
+# concatenating five bytes objects
+_RECORD_JOB_STRUCT = struct.Struct("<8sI20sQI")
+
 # Base rate
 MINT_PER_SECOND = 0.005
 
+# Balance reads within this window reuse the cached value
+_BALANCE_TTL_SECONDS = 60.0
+
+# A blockhash stays valid on-chain for ~150 slots (~60s); reuse it for
+# 45s so back-to-back recordings skip the fetch
+_BLOCKHASH_TTL_SECONDS = 45.0
+
+# Conservative instructions-per-transaction bound: ~100 bytes per job
+# (unique PDA key + metas + 44-byte data) on a ~330-byte base keeps a
+# packed tx under Solana's 1232-byte packet limit
+_MAX_JOBS_PER_TX = 8
+
+# Bounded attempts for flaky RPC calls on the recording path
+_RPC_RETRIES = 5
+
+
+class RecordWorkError(Exception):
+    """Raised when a work-recording RPC keeps failing after retries."""
+
+
+def _hash16(*parts: bytes) -> str:
+    """
+    16-hex-char digest of the given byte parts. The job hash is a local
+    uniqueness tag, not an on-chain verification input, so the SIMD
+    blake3 backend is used when installed; sha256 otherwise.
+    """
+    if _blake3 is not None:
+        h = _blake3()
+        for part in parts:
+            h.update(part)
+        # 8 bytes -> the same 16 hex chars the sha256 path keeps
+        return h.hexdigest(length=8)
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part)
+    return h.hexdigest()[:16]
+
 
 class MINTAgent:
     """
     MINT Protocol agent - earn tokens for your work.
-    
+
+    RPC calls are coroutines so agent loops can overlap network latency
+    instead of blocking a thread per round-trip.
+
     Example:
         agent = MINTAgent()
-        agent.init()
-        agent.record_work("completed task", duration_seconds=300)
+        await agent.init()
+        await agent.record_work("completed task", duration_seconds=300)
     """
     
     def __init__(self, keypair_path: Optional[str] = None, debug: bool = False):
+        _load_chain()
         self.debug = debug
         self.keypair_path = Path(keypair_path or os.path.expanduser("~/.mint/keypair.json"))
         self.keypair: Optional[Keypair] = None
-        self.client = Client(RPC_URL)
+        self.client = AsyncClient(RPC_URL)
+        # One keep-alive pool for every RPC - no TLS handshake per call.
+        # Shared with solana-py's provider so batch and SDK calls reuse
+        # the same connections.
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=4)
+        )
+        provider = getattr(self.client, "_provider", None)
+        if provider is not None and hasattr(provider, "session"):
+            provider.session = self._http
         self._initialized = False
+        # Filled by init(): the machine PDA and the static account metas
+        # never change for a given keypair, so they are derived once
+        # instead of per record_work call (PDA derivation is up to 255
+        # SHA-256 rounds)
+        self._machine_pda: Optional[Pubkey] = None
+        self._base_accounts: Optional[list] = None
+        self._wallet_bytes: Optional[bytes] = None
+        self._record_job_prefix = DISCRIMINATORS["record_job"]
+        # (fetched_at, value); dropped after a successful record_work
+        self._balance_cache: Optional[tuple] = None
+        # (fetched_at, Hash); invalidated on "blockhash not found"
+        self._blockhash_cache: Optional[tuple] = None
+        # Associated token account + mint decimals, resolved in init()
+        self._ata: Optional[Pubkey] = None
+        self._mint_decimals = 9
     
+    async def close(self):
+        """Close the RPC client and the shared HTTP connection pool."""
+        await self.client.close()
+        await self._http.aclose()
+
     def log(self, msg: str):
         if self.debug:
             print(f"[MINT] {msg}")
@@ -72,22 +204,45 @@ class MINTAgent:
             raise ValueError("Agent not initialized. Call init() first.")
         return str(self.keypair.pubkey())
     
-    def init(self) -> dict:
+    async def init(self) -> dict:
         if self.keypair_path.exists():
             self.log(f"Loading keypair from {self.keypair_path}")
-            with open(self.keypair_path, "r") as f:
-                secret = json.load(f)
-            self.keypair = Keypair.from_bytes(bytes(secret))
+            raw = self.keypair_path.read_bytes()
+            if raw[:1] == b"[":
+                # Pre-1.0 format: a JSON array of ints
+                raw = bytes(json.loads(raw))
+            self.keypair = Keypair.from_bytes(raw)
         else:
             self.log("Generating new keypair")
             self.keypair = Keypair()
             self.keypair_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.keypair_path, "w") as f:
-                json.dump(list(bytes(self.keypair)), f)
+            # Raw 64 bytes: no JSON parse or int-list decode on startup
+            with open(self.keypair_path, "wb") as f:
+                f.write(bytes(self.keypair))
             os.chmod(self.keypair_path, 0o600)
         
         self.log(f"Wallet: {self.wallet_address}")
-        registered = self._check_registered()
+
+        self._wallet_bytes = str(self.keypair.pubkey()).encode()
+        self._machine_pda = self._get_machine_pda()
+        # record_work splices the per-job PDA in at index 2
+        self._base_accounts = [
+            AccountMeta(pubkey=STATE_ACCOUNT, is_signer=False, is_writable=True),
+            AccountMeta(pubkey=self._machine_pda, is_signer=False, is_writable=True),
+            AccountMeta(pubkey=self.keypair.pubkey(), is_signer=True, is_writable=False),
+            AccountMeta(pubkey=ORACLE_PUBKEY, is_signer=True, is_writable=True),
+            AccountMeta(pubkey=SYSTEM_PROGRAM_ID, is_signer=False, is_writable=False),
+        ]
+
+        # The ATA is a pure derivation; balance reads hit it directly
+        # instead of paying a parsed getTokenAccountsByOwner scan
+        self._ata = get_associated_token_address(self.keypair.pubkey(), MINT_TOKEN_PUBKEY)
+        mint_info = await self.client.get_account_info(MINT_TOKEN_PUBKEY)
+        if mint_info.value is not None:
+            # SPL mint layout: u8 decimals at offset 44
+            self._mint_decimals = mint_info.value.data[44]
+
+        registered = await self._check_registered()
         self._initialized = True
         
         return {
@@ -104,79 +259,224 @@ class MINTAgent:
         )
         return pda
     
-    def _get_job_pda(self, job_hash: str) -> Pubkey:
-        hash_bytes = job_hash.encode()[:32]
+    def _get_job_pda(self, job_hash_bytes: bytes) -> Pubkey:
+        # Takes the already-encoded 20-byte buffer so the PDA seed and
+        # the instruction data can't drift apart
         pda, _ = Pubkey.find_program_address(
-            [b"job", hash_bytes],
+            [b"job", job_hash_bytes],
             PROGRAM_ID
         )
         return pda
     
-    def _check_registered(self) -> bool:
+    async def _check_registered(self) -> bool:
         if not self.keypair:
             return False
-        pda = self._get_machine_pda()
-        result = self.client.get_account_info(pda)
+        result = await self.client.get_account_info(self._machine_pda)
         return result.value is not None
     
+    async def _batch_rpc(self, calls: list) -> list:
+        """
+        POST several JSON-RPC calls to RPC_URL as one batch request.
+
+        Each entry is {"method": ..., "params": [...]}. Results are
+        returned in call order; responses are matched by id since the
+        server may reorder them. Cuts N HTTPS round-trips to one.
+        """
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": call["method"],
+             "params": call.get("params", [])}
+            for i, call in enumerate(calls)
+        ]
+        r = await self._http.post(RPC_URL, json=payload)
+        r.raise_for_status()
+        by_id = {item.get("id"): item for item in r.json()}
+        results = []
+        for i, call in enumerate(calls):
+            item = by_id.get(i)
+            if item is None:
+                raise RuntimeError(f"Batch RPC: no response for {call['method']} (id {i})")
+            if "error" in item:
+                raise RuntimeError(f"Batch RPC: {call['method']} failed: {item['error']}")
+            results.append(item["result"])
+        return results
+
+    async def cycle_snapshot(self) -> dict:
+        """
+        Fetch the latest blockhash, MINT balance and registration state
+        in one batched RPC instead of three sequential calls.
+
+        Returns {"blockhash": Hash, "balance": float, "registered": bool};
+        the blockhash can be passed straight to record_work().
+        """
+        if not self._initialized:
+            raise ValueError("Agent not initialized. Call init() first.")
+
+        blockhash_res, ata_res, machine_res = await self._batch_rpc([
+            {"method": "getLatestBlockhash", "params": []},
+            {"method": "getAccountInfo",
+             "params": [str(self._ata), {"encoding": "base64"}]},
+            {"method": "getAccountInfo", "params": [str(self._machine_pda)]},
+        ])
+
+        balance = 0.0
+        if ata_res["value"] is not None:
+            raw = base64.b64decode(ata_res["value"]["data"][0])
+            balance = int.from_bytes(raw[64:72], "little") / 10 ** self._mint_decimals
+        self._balance_cache = (time.time(), balance)
+
+        # The blockhash refresh piggybacks on the batch
+        blockhash = Hash.from_string(blockhash_res["value"]["blockhash"])
+        self._blockhash_cache = (time.time(), blockhash)
+
+        return {
+            "blockhash": blockhash,
+            "balance": balance,
+            "registered": machine_res["value"] is not None,
+        }
+
+    async def _get_blockhash(self) -> Hash:
+        """Latest blockhash, reused within _BLOCKHASH_TTL_SECONDS."""
+        if self._blockhash_cache is not None:
+            fetched_at, cached = self._blockhash_cache
+            if time.time() - fetched_at < _BLOCKHASH_TTL_SECONDS:
+                return cached
+        resp = await self._rpc_retry(
+            "get_latest_blockhash", self.client.get_latest_blockhash
+        )
+        blockhash = resp.value.blockhash
+        self._blockhash_cache = (time.time(), blockhash)
+        return blockhash
+
+    async def _rpc_retry(self, label: str, call, *args):
+        """
+        Run an RPC coroutine with bounded exponential backoff + jitter.
+        Transient failures (timeouts, dropped transactions) retry quickly
+        instead of surfacing immediately; persistent ones raise
+        RecordWorkError so callers can catch narrowly.
+
+        A stale blockhash is deterministic - replaying the same signed
+        transaction can never succeed - so it raises on the first
+        failure and _record re-signs against a fresh blockhash instead.
+        """
+        last_error = None
+        for attempt in range(_RPC_RETRIES):
+            try:
+                return await call(*args)
+            except Exception as e:
+                last_error = e
+                if "blockhash not found" in str(e).lower():
+                    raise RecordWorkError(f"{label} failed: {e}") from e
+                if attempt < _RPC_RETRIES - 1:
+                    delay = min(30, 2 ** attempt) + random.uniform(0, 0.5) * 2 ** attempt
+                    self.log(f"{label} failed (attempt {attempt + 1}/{_RPC_RETRIES}), "
+                             f"retrying in {delay:.1f}s: {e}")
+                    await asyncio.sleep(delay)
+        raise RecordWorkError(
+            f"{label} failed after {_RPC_RETRIES} attempts: {last_error}"
+        ) from last_error
+
     def _generate_job_hash(self, description: str) -> str:
-        raw = f"{self.wallet_address}|{description}|{time.time()}"
-        digest = hashlib.sha256(raw.encode()).hexdigest()
-        return f"job_{digest[:16]}"
+        # urandom nonce instead of str(time.time()): no float formatting
+        # or encode, and no collisions when several jobs land in the
+        # same clock tick
+        return "job_" + _hash16(
+            self._wallet_bytes, b"|", description.encode(), b"|", os.urandom(8)
+        )
     
-    def record_work(
-        self, 
-        description: str, 
+    async def record_work(
+        self,
+        description: str,
         duration_seconds: int,
-        complexity: float = 1.0
+        complexity: float = 1.0,
+        blockhash: Optional[Hash] = None
     ) -> str:
-        if not self._initialized:
-            raise ValueError("Agent not initialized. Call init() first.")
-        
+        complexity = max(0.5, min(2.0, complexity))
+        return await self._record(
+            description, duration_seconds, int(complexity * 1000), complexity, blockhash
+        )
+
+    def specialize(self, complexity: float = 1.0):
+        """
+        Partially evaluate record_work for a fixed complexity: the clamp
+        and complexity-int conversion run once here, and the returned
+        coroutine function does only the per-call work.
+
+            record = agent.specialize(complexity=1.0)
+            sig = await record("task", duration_seconds=120)
+        """
         complexity = max(0.5, min(2.0, complexity))
         complexity_int = int(complexity * 1000)
-        
+
+        async def record(description: str, duration_seconds: int,
+                         blockhash: Optional[Hash] = None) -> str:
+            return await self._record(
+                description, duration_seconds, complexity_int, complexity, blockhash
+            )
+
+        return record
+
+    async def _record(
+        self,
+        description: str,
+        duration_seconds: int,
+        complexity_int: int,
+        complexity: float,
+        blockhash: Optional[Hash]
+    ) -> str:
+        if not self._initialized:
+            raise ValueError("Agent not initialized. Call init() first.")
+
         job_hash = self._generate_job_hash(description)
-        machine_pda = self._get_machine_pda()
-        job_pda = self._get_job_pda(job_hash)
-        
+        job_hash_bytes = job_hash.encode()
+        job_pda = self._get_job_pda(job_hash_bytes)
+
         self.log(f"Recording: {description} ({duration_seconds}s, {complexity}x)")
-        
-        job_hash_bytes = job_hash.encode()[:32]
-        data = (
-            DISCRIMINATORS["record_job"] +
-            len(job_hash_bytes).to_bytes(4, "little") +
-            job_hash_bytes +
-            duration_seconds.to_bytes(8, "little") +
-            complexity_int.to_bytes(4, "little")
+
+        data = _RECORD_JOB_STRUCT.pack(
+            self._record_job_prefix, len(job_hash_bytes), job_hash_bytes,
+            duration_seconds, complexity_int
         )
-        
+
+        # Only the job PDA varies per call; everything else is cached
+        accounts = self._base_accounts.copy()
+        accounts.insert(2, AccountMeta(pubkey=job_pda, is_signer=False, is_writable=True))
+
         instruction = Instruction(
             program_id=PROGRAM_ID,
-            accounts=[
-                AccountMeta(pubkey=STATE_ACCOUNT, is_signer=False, is_writable=True),
-                AccountMeta(pubkey=machine_pda, is_signer=False, is_writable=True),
-                AccountMeta(pubkey=job_pda, is_signer=False, is_writable=True),
-                AccountMeta(pubkey=self.keypair.pubkey(), is_signer=True, is_writable=False),
-                AccountMeta(pubkey=ORACLE_PUBKEY, is_signer=True, is_writable=True),
-                AccountMeta(pubkey=SYSTEM_PROGRAM_ID, is_signer=False, is_writable=False),
-            ],
+            accounts=accounts,
             data=data,
         )
         
-        blockhash = self.client.get_latest_blockhash().value.blockhash
-        
-        msg = Message.new_with_blockhash(
-            [instruction],
-            ORACLE_PUBKEY,
-            blockhash
-        )
-        
-        tx = Transaction.new_unsigned(msg)
-        tx.partial_sign([self.keypair], blockhash)
-        
-        result = self.client.send_transaction(tx)
+        for attempt in range(2):
+            if blockhash is None:
+                blockhash = await self._get_blockhash()
+
+            msg = Message.new_with_blockhash(
+                [instruction],
+                ORACLE_PUBKEY,
+                blockhash
+            )
+
+            tx = Transaction.new_unsigned(msg)
+            tx.partial_sign([self.keypair], blockhash)
+
+            try:
+                result = await self._rpc_retry(
+                    "send_transaction", self.client.send_transaction, tx
+                )
+                break
+            except RecordWorkError as error:
+                if attempt == 1 or "blockhash not found" not in str(error).lower():
+                    raise
+                # The cached or caller-supplied blockhash aged out;
+                # re-sign against a fresh one and retry once
+                self.log("Blockhash expired; refreshing and retrying")
+                self._blockhash_cache = None
+                blockhash = None
+
         sig = str(result.value)
+        # The recorded job changes the balance; force a fresh read next time
+        self._balance_cache = None
         
         expected_mint = duration_seconds * MINT_PER_SECOND * complexity
         self.log(f"Recorded! Expected: ~{expected_mint:.3f} MINT")
@@ -184,30 +484,179 @@ class MINTAgent:
         
         return sig
     
-    def get_mint_balance(self) -> float:
+    async def record_many(self, jobs: list) -> list:
+        """
+        Record several jobs at once. Each entry is (description,
+        duration_seconds) or (description, duration_seconds, complexity).
+
+        Hashes are computed in one tight loop, instructions are packed
+        up to _MAX_JOBS_PER_TX per transaction, and multiple
+        transactions go out as one batched sendTransaction RPC.
+        Returns the transaction signatures.
+        """
         if not self._initialized:
             raise ValueError("Agent not initialized. Call init() first.")
-        
-        mint_pubkey = Pubkey.from_string(MINT_TOKEN)
-        
-        result = self.client.get_token_accounts_by_owner_json_parsed(
-            self.keypair.pubkey(),
-            {"mint": mint_pubkey}
-        )
-        
-        if result.value:
-            for account in result.value:
-                info = account.account.data.parsed["info"]
-                if info["mint"] == MINT_TOKEN:
-                    return float(info["tokenAmount"]["uiAmount"] or 0)
-        
-        return 0.0
+        if not jobs:
+            return []
+
+        instructions = []
+        for job in jobs:
+            description, duration_seconds = job[0], job[1]
+            complexity = max(0.5, min(2.0, job[2] if len(job) > 2 else 1.0))
+            complexity_int = int(complexity * 1000)
+
+            job_hash = self._generate_job_hash(description)
+            job_hash_bytes = job_hash.encode()
+            job_pda = self._get_job_pda(job_hash_bytes)
+
+            data = _RECORD_JOB_STRUCT.pack(
+                self._record_job_prefix, len(job_hash_bytes), job_hash_bytes,
+                duration_seconds, complexity_int
+            )
+
+            accounts = self._base_accounts.copy()
+            accounts.insert(2, AccountMeta(pubkey=job_pda, is_signer=False, is_writable=True))
+            instructions.append(Instruction(
+                program_id=PROGRAM_ID,
+                accounts=accounts,
+                data=data,
+            ))
+
+        blockhash = await self._get_blockhash()
+
+        txs = []
+        for i in range(0, len(instructions), _MAX_JOBS_PER_TX):
+            msg = Message.new_with_blockhash(
+                instructions[i:i + _MAX_JOBS_PER_TX],
+                ORACLE_PUBKEY,
+                blockhash
+            )
+            tx = Transaction.new_unsigned(msg)
+            tx.partial_sign([self.keypair], blockhash)
+            txs.append(tx)
+
+        if len(txs) == 1:
+            result = await self._rpc_retry("send_transaction", self.client.send_transaction, txs[0])
+            sigs = [str(result.value)]
+        else:
+            results = await self._batch_rpc([
+                {"method": "sendTransaction",
+                 "params": [base64.b64encode(bytes(tx)).decode(),
+                            {"encoding": "base64"}]}
+                for tx in txs
+            ])
+            sigs = [str(r) for r in results]
+
+        self._balance_cache = None
+        self.log(f"Recorded {len(jobs)} jobs in {len(txs)} transaction(s)")
+        return sigs
+
+    async def get_mint_balance(self) -> float:
+        if not self._initialized:
+            raise ValueError("Agent not initialized. Call init() first.")
+
+        if self._balance_cache is not None:
+            fetched_at, balance = self._balance_cache
+            if time.time() - fetched_at < _BALANCE_TTL_SECONDS:
+                return balance
+
+        # Single 165-byte account fetch of the known ATA - no parsed-JSON
+        # token account scan
+        result = await self.client.get_account_info(self._ata)
+
+        balance = 0.0
+        if result.value is not None:
+            # SPL token account layout: u64 amount at offset 64
+            amount = int.from_bytes(result.value.data[64:72], "little")
+            balance = amount / 10 ** self._mint_decimals
+
+        self._balance_cache = (time.time(), balance)
+        return balance
     
     def estimate_earnings(self, duration_seconds: int, complexity: float = 1.0) -> float:
         return duration_seconds * MINT_PER_SECOND * complexity
 
 
+class MINTWorkQueue:
+    """
+    Share one MINTAgent across many logical workers.
+
+    Producers await submit(); a single drain_loop() consumer collects
+    whatever accumulates within batch_delay_ms and records it through
+    record_many, so N workers share one connection pool and their jobs
+    pack into as few transactions as possible.
+
+    Example:
+        queue = MINTWorkQueue(agent)
+        drain = asyncio.create_task(queue.drain_loop())
+
+        sig = await queue.submit("task", duration_seconds=120)
+
+        await queue.close()
+        await drain
+    """
+
+    def __init__(self, agent: MINTAgent, max_batch: int = 4 * _MAX_JOBS_PER_TX):
+        self.agent = agent
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._closed = False
+
+    async def submit(self, description: str, duration_seconds: int,
+                     complexity: float = 1.0) -> str:
+        """Queue one job; resolves to its transaction signature."""
+        if self._closed:
+            raise RuntimeError("MINTWorkQueue is closed")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((description, duration_seconds, complexity), future))
+        return await future
+
+    async def close(self):
+        """Stop the drain loop once queued jobs have been recorded."""
+        self._closed = True
+        await self._queue.put(None)
+
+    async def drain_loop(self, batch_delay_ms: int = 10):
+        """Consume submissions until close(); one record_many per batch."""
+        delay = batch_delay_ms / 1000.0
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            # Let nearby submissions pile up so they share a batch
+            await asyncio.sleep(delay)
+            batch = [item]
+            draining = True
+            while len(batch) < self.max_batch:
+                try:
+                    nxt = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if nxt is None:
+                    draining = False
+                    break
+                batch.append(nxt)
+
+            try:
+                sigs = await self.agent.record_many([job for job, _ in batch])
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+            else:
+                # record_many returns one signature per packed transaction
+                for i, (_, future) in enumerate(batch):
+                    if not future.done():
+                        future.set_result(sigs[i // _MAX_JOBS_PER_TX])
+
+            if not draining:
+                return
+
+
 def quick_record(description: str, duration_seconds: int) -> str:
-    agent = MINTAgent()
-    agent.init()
-    return agent.record_work(description, duration_seconds)
+    """Synchronous one-shot helper for scripts without an event loop."""
+    async def _run():
+        agent = MINTAgent()
+        await agent.init()
+        return await agent.record_work(description, duration_seconds)
+    return asyncio.run(_run())